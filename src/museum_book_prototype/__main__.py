@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 """Museum Book Prototype package entry point."""
 
+import atexit
 import logging as lg
+import queue
 import threading
 
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 from museum_book_prototype.serial_receiver import SerialReceiver
 from museum_book_prototype.parse import DataParser
@@ -12,25 +14,28 @@ from museum_book_prototype.switch_states import SwitchStates
 from museum_book_prototype.app import App
 
 
-def main() -> None:
-    """Main function to start the Museum Book Prototype application."""
+_log_listener: QueueListener | None = None
+
+
+def setup_logging() -> None:
+    """Configure root logging once, replacing any handlers installed before."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
     log_format: str = (
         "%(asctime)s : %(levelname)-8s : %(threadName)s : %(filename)s:"
         "%(lineno)d : %(name)s :: %(message)s"
     )
-    lg.basicConfig(
-        level=lg.INFO,
-        handlers=[
-            lg.StreamHandler(),
-            TimedRotatingFileHandler(
-                filename="logs/mbp.log",
-                when="midnight",
-                interval=1,
-                backupCount=7,
-                encoding="utf-8",
-            ),
-        ],
-        format=log_format,
+    formatter = lg.Formatter(log_format)
+
+    stream_handler = lg.StreamHandler()
+    file_handler = TimedRotatingFileHandler(
+        filename="logs/mbp.log",
+        when="midnight",
+        interval=1,
+        backupCount=7,
+        encoding="utf-8",
     )
     error_handler = TimedRotatingFileHandler(
         filename="logs/mbp_errors.log",
@@ -40,8 +45,31 @@ def main() -> None:
         encoding="utf-8",
     )
     error_handler.setLevel(lg.ERROR)
-    error_handler.setFormatter(lg.Formatter(log_format))
-    lg.getLogger().addHandler(error_handler)
+    for handler in (stream_handler, file_handler, error_handler):
+        handler.setFormatter(formatter)
+
+    # write log records from a background thread so callers never block on I/O
+    log_queue: queue.Queue[lg.LogRecord] = queue.Queue(-1)
+    root_logger = lg.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.setLevel(lg.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(
+        log_queue,
+        stream_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True,
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    _log_listener = listener
+
+
+def main() -> None:
+    """Main function to start the Museum Book Prototype application."""
+    setup_logging()
 
     lg.info("hello!")
 
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging as lg
 import time
 from pathlib import Path
@@ -11,6 +12,12 @@ from typing import Any
 import pygame as pg
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+from museum_book_prototype.switch_states import PAGE_COUNT, PAGE_KEYS
 from museum_book_prototype.video_stream import VideoStream
 
 
@@ -33,6 +40,67 @@ PAGE_LABELS: dict[str | None, str | None] = {
     None: "None",
 }
 
+ALL_PAGES: int = (1 << PAGE_COUNT) - 1
+
+
+def pages_in_mask(mask: int) -> list[int]:
+    """Return the 1-based page numbers whose bits are set in ``mask``.
+
+    Args:
+        mask (int): Page bitmask, bit 0 being page 1.
+
+    Returns:
+        list[int]: Sorted page numbers.
+    """
+    return [i + 1 for i in range(PAGE_COUNT) if mask >> i & 1]
+
+
+def resolve_page(opens: int, closes: int) -> tuple[str | None, str | None]:
+    """Pick the page to show for valid, non-floating switch masks.
+
+    Args:
+        opens (int): Bitmask of OPEN switches, bit 0 being page 1.
+        closes (int): Bitmask of CLOSED switches, bit 0 being page 1.
+
+    Returns:
+        tuple[str | None, str | None]: The page identifier and an optional debug
+            message describing the decision.
+    """
+    open_only = opens & ~closes
+
+    if closes == ALL_PAGES and not opens:
+        return "front_cover", "All pages closed -> page1"
+
+    if opens == ALL_PAGES and not closes:
+        return "back_cover", "All pages open -> page6"
+
+    # If page5 is OPEN and not CLOSED, show page6
+    if open_only >> (PAGE_COUNT - 1) & 1:
+        return "back_cover", None
+
+    if open_only:
+        return f"page{open_only.bit_length()}", None
+
+    return None, "Unable to determine page from inputs; setting current_page = None"
+
+
+# page decision for every (opens | closes << PAGE_COUNT) switch combination
+PAGE_TABLE: tuple[tuple[str | None, str | None], ...] = tuple(
+    resolve_page(state & ALL_PAGES, state >> PAGE_COUNT)
+    for state in range(1 << 2 * PAGE_COUNT)
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> dict[str, Any]:
+    """Parse ``config.yaml`` once per process.
+
+    Returns:
+        dict[str, Any]: Configuration dictionary.
+    """
+    with open("config.yaml", "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 
 class App:
     """Main application class."""
@@ -46,6 +114,8 @@ class App:
 
         self.config: dict[str, Any] = self.get_config()
         self.inputs: dict[str, bool] = {}
+        # set by handle_input; start dirty so the empty inputs get evaluated once
+        self._inputs_dirty: bool = True
 
         cache_dir_setting = self.config.get("frame_cache_dir", "assets/frame_cache")
         self.cache_root: Path = Path(cache_dir_setting)
@@ -58,15 +128,26 @@ class App:
             raise
 
         _ = pg.init()
-        self.screen: pg.Surface = pg.display.set_mode((0, 0), pg.FULLSCREEN)
+        self.screen: pg.Surface = self._open_display()
         pg.display.set_caption("Museum Book Prototype")
+        # only QUIT is handled; keep everything else out of the event queue
+        pg.event.set_blocked(None)
+        pg.event.set_allowed(pg.QUIT)
 
-        self.error_surface: pg.Surface = pg.Surface((self.screen.get_width() - 40, 200))
+        self.error_surface: pg.Surface = pg.Surface(
+            (self.screen.get_width() - 40, 200)
+        ).convert()
         _ = self.error_surface.fill((255, 255, 255))
         self.error_surface.set_colorkey((255, 255, 255))
         self.error_surface.set_alpha(200)
+        self.error_rect: pg.Rect = self.error_surface.get_rect(topleft=(20, 20))
+        self.error_font: pg.font.Font = pg.font.SysFont(None, 20)
+        self._error_text_key: tuple[bool, ...] | None = None
+        self._error_text_cache: str = ""
 
-        self.background_surface: pg.Surface = pg.Surface(self.screen.get_size())
+        self.background_surface: pg.Surface = pg.Surface(
+            self.screen.get_size()
+        ).convert()
 
         # set background from assets/background.jpg
         bg_path = Path("assets/background.jpg")
@@ -89,18 +170,29 @@ class App:
             )
 
         self._current_page: str | None = None
+        self._last_frame_key: tuple[str | None, int | None] | None = None
+        self._last_error_text: str | None = None
 
         self.clock: pg.time.Clock = pg.time.Clock()
         self.running: bool = True
 
         self.target_fps: int = self._config_int("target_fps", 24)
         self.max_video_fps: float = self._config_float("max_video_fps", 24.0)
+        self.precise_timing: bool = self._config_bool("precise_timing", False)
+        self.preload_frames: bool = self._config_bool("preload_frames", False)
+        self.surface_cache_frames: int = self._config_int(
+            "surface_cache_frames", 0, minimum=0
+        )
+        self.smooth_scaling: bool = self._config_bool("smooth_scaling", True)
 
         self.floating_start_time: float | None = None
-        self.floating_pages: set[int] | None = None
+        self.floating_mask: int = 0
 
         self.suspected_faulty: list[int] | None = None
-        self.reported_faults: set[frozenset[int]] = set()
+        # pages with a reported contactor fault, bit 0 being page 1
+        self.reported_single: int = 0
+        # floating masks whose timeout has already been reported
+        self.reported_floating: set[int] = set()
 
         self.critical_errors: dict[str, bool] = {
             "serial_fail": False,
@@ -190,6 +282,93 @@ class App:
 
         return scaled_width, scaled_height
 
+    def _open_display(self) -> pg.Surface:
+        """Open the fullscreen display surface.
+
+        If ``render_resolution`` is configured, render at that fixed logical size
+        and let SDL scale it to the screen on the GPU with vsync enabled. A value
+        that is not a pair of positive integers falls back to the native mode.
+
+        Returns:
+            pg.Surface: The display surface.
+        """
+        render_resolution = self.config.get("render_resolution")
+        if not render_resolution:
+            return pg.display.set_mode((0, 0), pg.FULLSCREEN)
+        if (
+            not isinstance(render_resolution, (list, tuple))
+            or len(render_resolution) != 2
+            or not all(
+                isinstance(value, int) and not isinstance(value, bool) and value > 0
+                for value in render_resolution
+            )
+        ):
+            self.logger.warning(
+                "Invalid render_resolution in config: %r; using the native resolution",
+                render_resolution,
+            )
+            return pg.display.set_mode((0, 0), pg.FULLSCREEN)
+
+        size = (render_resolution[0], render_resolution[1])
+        flags = pg.FULLSCREEN | pg.SCALED
+        try:
+            return pg.display.set_mode(size, flags, vsync=1)
+        except pg.error:
+            self.logger.warning("Vsync unavailable, opening the display without it")
+            return pg.display.set_mode(size, flags)
+
+    def _error_text(self) -> str:
+        """Build the error banner text, reusing it while the error state is unchanged.
+        The error overlay surface is redrawn only when the text changes.
+
+        Returns:
+            str: Newline-separated error lines, or an empty string if there are none.
+        """
+        key = (
+            self.critical_errors["serial_fail"],
+            self.critical_errors["serial_waiting"],
+            self.critical_errors["video_load_failure"],
+            bool(self.suspected_faulty),
+        )
+        if key == self._error_text_key:
+            return self._error_text_cache
+
+        error_text: str = ""
+
+        if self.critical_errors["serial_fail"]:
+            error_text += "Cannot connect to serial port.\n"
+
+        if self.critical_errors["serial_waiting"]:
+            error_text += "Waiting for serial device...\n"
+            # TODO: determine if should show blank screen here
+
+        if self.critical_errors["video_load_failure"]:
+            error_text += "Failed to load video clips.\n"
+
+        # if self.reported_single:
+        #     error_text += f"{', '.join(str(i) for i in pages_in_mask(self.reported_single))}\n"
+
+        if self.suspected_faulty:
+            error_text = "!"
+
+        self._error_text_key = key
+        if error_text != self._error_text_cache:
+            self._render_error_surface(error_text)
+        self._error_text_cache = error_text
+        return error_text
+
+    def _render_error_surface(self, error_text: str) -> None:
+        """Redraw the error overlay surface for the given error text.
+
+        Args:
+            error_text (str): Newline-separated error lines.
+        """
+        _ = self.error_surface.fill((255, 255, 255))
+        lines = error_text.strip().split("\n")
+        for i, line in enumerate(lines):
+            text_surf = self.error_font.render(line, False, (255, 0, 0))
+            _ = self.error_surface.blit(text_surf, (0, 0 + i * 24))
+
     def get_config(self) -> dict:
         """Load configuration from YAML file.
 
@@ -198,15 +377,13 @@ class App:
         """
         self.logger.debug("Loading configuration...")
         try:
-            with open("config.yaml", "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
-            return config
+            return _load_config()
         except FileNotFoundError:
             self.logger.exception("Configuration file not found.")
             return {}
 
-    def _config_int(self, key: str, default: int) -> int:
-        """Return a positive integer configuration value."""
+    def _config_int(self, key: str, default: int, minimum: int = 1) -> int:
+        """Return an integer configuration value of at least ``minimum``."""
 
         raw_value = self.config.get(key, default)
         try:
@@ -214,13 +391,22 @@ class App:
         except (TypeError, ValueError):
             self.logger.warning("Invalid %s in config; defaulting to %s", key, default)
             return default
-        if value <= 0:
+        if value < minimum:
             self.logger.warning(
-                "Non-positive %s in config; defaulting to %s", key, default
+                "%s in config is below %d; defaulting to %s", key, minimum, default
             )
             return default
         return value
 
+    def _config_bool(self, key: str, default: bool) -> bool:
+        """Return a boolean configuration value."""
+
+        raw_value = self.config.get(key, default)
+        if not isinstance(raw_value, bool):
+            self.logger.warning("Invalid %s in config; defaulting to %s", key, default)
+            return default
+        return raw_value
+
     def _config_float(self, key: str, default: float) -> float:
         """Return a positive float configuration value."""
 
@@ -251,7 +437,10 @@ class App:
 
         for key, path in VIDEO_SOURCES.items():
             video_path = Path(path)
-            if not video_path.is_file():
+            transcoded_path = self._transcoded_path(video_path)
+            if transcoded_path is not None:
+                video_path = transcoded_path
+            elif not video_path.is_file():
                 self.logger.error("Video file for %s not found at %s", key, video_path)
                 missing_any = True
                 continue
@@ -262,6 +451,9 @@ class App:
                 target_size=target_size,
                 cache_root=self.cache_root,
                 logger=self.logger.getChild(f"VideoStream[{key}]"),
+                preload=self.preload_frames,
+                surface_cache_size=self.surface_cache_frames,
+                smooth_scaling=self.smooth_scaling,
             )
             self.video_times[key] = 0.0
             self.logger.debug("Prepared lazy stream for %s from %s", key, video_path)
@@ -269,44 +461,84 @@ class App:
         if missing_any:
             self.critical_errors["video_load_failure"] = True
 
+    def _transcoded_path(self, video_path: Path) -> Path | None:
+        """Return the display-sized copy of a video made by prepare_assets.
+
+        Args:
+            video_path (Path): The configured source video.
+
+        Returns:
+            Path | None: The ``.mp4`` next to the source if it exists and is not
+                older than the source, otherwise None.
+        """
+        transcoded_path = video_path.with_suffix(".mp4")
+        if transcoded_path == video_path:
+            return None
+        try:
+            transcoded_mtime = transcoded_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        try:
+            source_mtime = video_path.stat().st_mtime
+        except FileNotFoundError:
+            # only the transcoded copy is installed
+            return transcoded_path
+        if transcoded_mtime < source_mtime:
+            self.logger.warning(
+                "Ignoring %s: older than %s; rerun prepare_assets",
+                transcoded_path,
+                video_path,
+            )
+            return None
+        return transcoded_path
+
     def _close_videos(self) -> None:
         """Release all video stream resources."""
 
         for stream in self.videos.values():
             stream.close()
 
-    def _check_invalid_state(self, page_states: list[tuple[bool, bool]]) -> None:
+    def _check_invalid_state(self, opens: int, closes: int) -> None:
         """Check for any page with both OPEN and CLOSED and report it.
         This marks the page as suspected_faulty, resets floating timers, sets current_page
         to None and logs an error the first time the fault is observed.
 
         Args:
-            page_states (list[tuple[bool, bool]]): List of (OPEN, CLOSED) states for each page.
+            opens (int): Bitmask of OPEN switches, bit 0 being page 1.
+            closes (int): Bitmask of CLOSED switches, bit 0 being page 1.
         """
-        for i, (open_, close) in enumerate(page_states, start=1):
-            if open_ and close:
-                self.logger.warning(f"Invalid state for page {i}: both OPEN and CLOSED")
-                self.floating_start_time = None
-                self.floating_pages = None
-                self.suspected_faulty = [i]
-                self.current_page = None
-                fault_key = frozenset({i})
-                if fault_key not in self.reported_faults:
-                    self.reported_faults.add(fault_key)
-                    msg = f"Contactor fault detected on page {i}: both OPEN and CLOSED"
-                    self.logger.error(msg)
-                else:
-                    self.logger.debug(
-                        f"Fault for page {i} already reported; not logging again."
-                    )
-                return
-            else:
-                fault_key = frozenset({i})
-                if fault_key in self.reported_faults:
-                    self.reported_faults.discard(fault_key)
-                    self.logger.debug(
-                        f"Contactor fault on page {i} cleared; removing from reported faults."
-                    )
+        invalid = opens & closes
+        # lowest invalid page; pages below it are the ones known to be healthy
+        first_invalid = invalid & -invalid
+        healthy = first_invalid - 1 if invalid else ALL_PAGES
+
+        cleared = self.reported_single & healthy
+        if cleared:
+            self.reported_single &= ~cleared
+            for i in pages_in_mask(cleared):
+                self.logger.debug(
+                    "Contactor fault on page %d cleared; removing from reported faults.",
+                    i,
+                )
+
+        if not invalid:
+            return
+
+        i = first_invalid.bit_length()
+        self.logger.warning("Invalid state for page %d: both OPEN and CLOSED", i)
+        # forget the abandoned timer's report so a repeat timeout is logged again
+        self.reported_floating.discard(self.floating_mask)
+        self.floating_start_time = None
+        self.floating_mask = 0
+        self.suspected_faulty = [i]
+        self.current_page = None
+        if not self.reported_single & first_invalid:
+            self.reported_single |= first_invalid
+            self.logger.error(
+                "Contactor fault detected on page %d: both OPEN and CLOSED", i
+            )
+        else:
+            self.logger.debug("Fault for page %d already reported; not logging again.", i)
 
     def handle_input(self, inputs: dict[str, bool]) -> None:
         """Public method to handle input updates.
@@ -315,6 +547,7 @@ class App:
             inputs (dict[str, bool]): Dictionary of switch states.
         """
         self.inputs = inputs
+        self._inputs_dirty = True
 
     def _handle_input(self, inputs: dict[str, bool]) -> None:
         """Update current_page based on the 5 pairs of OPEN/CLOSED switches.
@@ -324,93 +557,67 @@ class App:
         Args:
             inputs (dict[str, bool]): Dictionary of switch states.
         """
-        page_states: list[tuple[bool, bool]] = [
-            (
-                bool(inputs.get(f"page{i}_open", False)),
-                bool(inputs.get(f"page{i}_close", False)),
-            )
-            for i in range(1, 6)
-        ]
+        opens = 0
+        closes = 0
+        for i, (open_key, close_key) in enumerate(PAGE_KEYS):
+            if inputs.get(open_key, False):
+                opens |= 1 << i
+            if inputs.get(close_key, False):
+                closes |= 1 << i
 
-        self._check_invalid_state(page_states)
+        self._check_invalid_state(opens, closes)
 
         # if any page is floating (neither open nor close) - start/continue floating timer.
-        floating_now = {
-            i
-            for i, (open_, close) in enumerate(page_states, start=1)
-            if (not open_ and not close)
-        }
-        if floating_now:
+        floating = ~(opens | closes) & ALL_PAGES
+        if floating:
             now = time.time()
             # if set of floating pages changed, restart timer with new set
-            if self.floating_start_time is None or self.floating_pages != floating_now:
+            if self.floating_start_time is None or self.floating_mask != floating:
                 self.floating_start_time = now
-                self.floating_pages = set(floating_now)
-                self.logger.debug(
-                    f"Floating state started for pages {sorted(self.floating_pages)} at {self.floating_start_time}"
-                )
+                self.floating_mask = floating
+                if self.logger.isEnabledFor(lg.DEBUG):
+                    self.logger.debug(
+                        "Floating state started for pages %s at %s",
+                        pages_in_mask(self.floating_mask),
+                        self.floating_start_time,
+                    )
             else:
                 elapsed = now - self.floating_start_time
-                self.logger.debug(
-                    f"Floating state for pages {sorted(self.floating_pages)} elapsed: {elapsed:.1f}s"
-                )
+                if self.logger.isEnabledFor(lg.DEBUG):
+                    self.logger.debug(
+                        "Floating state for pages %s elapsed: %.1fs",
+                        pages_in_mask(self.floating_mask),
+                        elapsed,
+                    )
                 if elapsed > 30.0:
-                    fault_key = frozenset(self.floating_pages)
-                    if fault_key not in self.reported_faults:
+                    if self.floating_mask not in self.reported_floating:
                         # mark suspected faulty contactors
-                        self.suspected_faulty = sorted(self.floating_pages)
-                        msg = f"Floating state for pages {self.suspected_faulty} persisted longer than 30 seconds"
-                        self.reported_faults.add(fault_key)
-                        self.logger.error(msg)
-                    else:
+                        self.suspected_faulty = pages_in_mask(self.floating_mask)
+                        self.reported_floating.add(self.floating_mask)
+                        self.logger.error(
+                            "Floating state for pages %s persisted longer than 30 seconds",
+                            self.suspected_faulty,
+                        )
+                    elif self.logger.isEnabledFor(lg.DEBUG):
                         self.logger.debug(
-                            f"Floating fault for pages {sorted(self.floating_pages)} already reported; not logging again."
+                            "Floating fault for pages %s already reported; not logging again.",
+                            pages_in_mask(self.floating_mask),
                         )
             # unset current page while floating
             self.current_page = None
             return
         else:
-            if self.floating_pages:
-                previously_floating_key = frozenset(self.floating_pages)
-
-                if previously_floating_key in self.reported_faults:
-                    self.reported_faults.discard(previously_floating_key)
+            if self.floating_mask:
+                self.reported_floating.discard(self.floating_mask)
 
             self.floating_start_time = None
-            self.floating_pages = None
+            self.floating_mask = 0
             self.suspected_faulty = None
 
-        all_open = all(open_ and not close for open_, close in page_states)
-        all_closed = all(close and not open_ for open_, close in page_states)
-
-        if all_closed:
-            self.current_page = "front_cover"
-            self.logger.debug("All pages closed -> page1")
-            return
-
-        if all_open:
-            self.current_page = "back_cover"
-            self.logger.debug("All pages open -> page6")
-            return
-
-        # If page5 is OPEN and not CLOSED, show page6
-        p5_open, p5_close = page_states[4]
-        if p5_open and not p5_close:
-            self.current_page = "back_cover"
-            return
-
-        open_pages = [
-            i + 1 for i, (open_, close) in enumerate(page_states) if open_ and not close
-        ]
-        if open_pages:
-            chosen = max(open_pages)
-            self.current_page = f"page{chosen}"
-            return
-
-        self.logger.debug(
-            "Unable to determine page from inputs; setting current_page = None"
-        )
-        self.current_page = None
+        page, message = PAGE_TABLE[opens | closes << PAGE_COUNT]
+        if message:
+            self.logger.debug(message)
+        self.current_page = page
 
     def run(self) -> None:
         """Run the main application loop."""
@@ -418,57 +625,55 @@ class App:
         for key in self.videos:
             self.videos[key].ensure_cache()
 
-        while self.running:
-            dt = self.clock.tick(self.target_fps) / 1000.0
+        # restart the clock so the first dt does not include cache building
+        _ = self.clock.tick()
+        tick = self.clock.tick_busy_loop if self.precise_timing else self.clock.tick
 
-            self._handle_input(self.inputs)
+        while self.running:
+            dt = tick(self.target_fps) / 1000.0
 
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    self.running = False
+            # unchanged inputs only matter while the floating timer is running
+            if self._inputs_dirty or self.floating_start_time is not None:
+                self._inputs_dirty = False
+                self._handle_input(self.inputs)
 
-            # _ = self.screen.fill(self.config.get("background_color", (255, 255, 255)))
-            _ = self.screen.blit(self.background_surface, (0, 0))
+            if pg.event.peek(pg.QUIT):
+                self.running = False
 
             current_page = self.current_page
             stream = self.videos.get(current_page) if current_page else None
+            frame_surface: pg.Surface | None = None
             if stream:
                 frame_surface = stream.advance(dt)
-                if frame_surface is not None:
-                    _ = self.screen.blit(frame_surface, (0, 0))
-                    if current_page in self.video_times:
-                        self.video_times[current_page] = stream.elapsed_time
-
-            error_text: str = ""
-
-            if self.critical_errors["serial_fail"]:
-                error_text += "Cannot connect to serial port.\n"
-
-            if self.critical_errors["serial_waiting"]:
-                error_text += "Waiting for serial device...\n"
-                # TODO: determine if should show blank screen here
+                if frame_surface is not None and current_page in self.video_times:
+                    self.video_times[current_page] = stream.elapsed_time
 
-            if self.critical_errors["video_load_failure"]:
-                error_text += "Failed to load video clips.\n"
+            error_text = self._error_text()
 
-            # if self.reported_faults:
-            #     error_text += f"{', '.join(str(i) for fault in self.reported_faults for i in sorted(fault))}\n"
-
-            if self.suspected_faulty:
-                error_text = "!"
-
-            # check if any errors occured
-            _ = self.error_surface.fill((255, 255, 255))
-            if error_text:
-                font = pg.font.SysFont(None, 20)
-                lines = error_text.strip().split("\n")
-                for i, line in enumerate(lines):
-                    text_surf = font.render(line, False, (255, 0, 0))
-                    _ = self.error_surface.blit(text_surf, (0, 0 + i * 24))
-
-            _ = self.screen.blit(self.error_surface, (20, 20))
+            frame_key = (
+                current_page,
+                stream.frame_index if frame_surface is not None else None,
+            )
+            if frame_key != self._last_frame_key:
+                # new video frame or page: repaint and present the whole screen
+                _ = self.screen.blit(self.background_surface, (0, 0))
+                if frame_surface is not None:
+                    _ = self.screen.blit(frame_surface, (0, 0))
+                if error_text:
+                    _ = self.screen.blit(self.error_surface, self.error_rect)
+                pg.display.flip()
+            elif error_text != self._last_error_text:
+                # only the error overlay changed: repaint just its area
+                area = self.error_rect
+                _ = self.screen.blit(self.background_surface, area, area)
+                if frame_surface is not None:
+                    _ = self.screen.blit(frame_surface, area, area)
+                if error_text:
+                    _ = self.screen.blit(self.error_surface, area)
+                pg.display.update(area)
 
-            pg.display.flip()
+            self._last_frame_key = frame_key
+            self._last_error_text = error_text
 
         self.logger.debug("Exiting...")
         self._close_videos()
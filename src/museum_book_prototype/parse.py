@@ -8,6 +8,9 @@ from typing import Callable
 import logging as lg
 
 
+SWITCH_VALUES: dict[str, bool] = {"0": False, "1": True}
+
+
 class DataParser:
     """Data parser class."""
 
@@ -34,6 +37,7 @@ class DataParser:
             8: "page5_open",
             9: "page5_close",
         }
+        self.keys: tuple[str, ...] = tuple(self.map[i] for i in range(len(self.map)))
         self.state_update_callback: Callable[[dict[str, bool]], None] = (
             state_update_callback
         )
@@ -46,9 +50,11 @@ class DataParser:
             line (str): The line of data to parse.
         """
         # self.logger.debug(f"Input line for parsing: {line}")
-        self.parsed = self.parse_line(line)
-        if self.parsed:
-            self.state_update_callback(self.parsed)
+        parsed = self.parse_line(line)
+        # the device repeats its state continuously; only report changes
+        if parsed and parsed != self.parsed:
+            self.parsed = parsed
+            self.state_update_callback(parsed)
 
     def parse_line(self, line: str):
         """Parse a line of CSV switch states.
@@ -58,17 +64,26 @@ class DataParser:
         Returns:
             dict[int, bool]: Parsed data as a dictionary.
         """
+        states = line.strip().split(",")
+        if len(states) == len(self.keys):
+            # fast path for the usual well-formed line of 0/1 values
+            try:
+                return {
+                    key: SWITCH_VALUES[state] for key, state in zip(self.keys, states)
+                }
+            except KeyError:
+                pass
+
         parsed_data: dict[str, bool] = {}
         try:
-            states = line.strip().split(",")
             if len(states) != 10:
                 self.logger.warning(
-                    f"Unexpected number of states: {len(states)}. Expected: 10"
+                    "Unexpected number of states: %d. Expected: 10", len(states)
                 )
             for index, state in enumerate(states):
                 key = self.map.get(index, f"unknown_{index}")
                 parsed_data[key] = bool(int(state))
 
         except ValueError as e:
-            self.logger.error(f"Failed to parse line: {line}. Error: {e}")
+            self.logger.error("Failed to parse line: %s. Error: %s", line, e)
         return parsed_data
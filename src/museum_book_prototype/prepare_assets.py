@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Transcode the source videos to display-sized, keyframe-only MP4 files.
+
+Run once per installation with ``python -m museum_book_prototype.prepare_assets
+--size WIDTHxHEIGHT``. The app prefers an ``.mp4`` next to each configured
+``.mov``, so the frame caches are then built from the smaller files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging as lg
+import os
+import subprocess
+from pathlib import Path
+
+from museum_book_prototype.app import VIDEO_SOURCES
+
+logger: lg.Logger = lg.getLogger(__name__)
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    """Parse a ``WIDTHxHEIGHT`` string.
+
+    Args:
+        value (str): Size string, e.g. ``1920x1080``.
+
+    Returns:
+        tuple[int, int]: The width and height.
+    """
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value}") from e
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value}")
+    return width, height
+
+
+def transcode(source: Path, target: Path, size: tuple[int, int], crf: int) -> None:
+    """Transcode ``source`` to an intra-only H.264 file scaled to ``size``.
+
+    The output is written to a temporary file and only moved to ``target`` once
+    ffmpeg succeeds, so an interrupted run never leaves a truncated video.
+
+    Args:
+        source (Path): Source video file.
+        target (Path): Output MP4 file.
+        size (tuple[int, int]): Output width and height.
+        crf (int): x264 constant rate factor.
+    """
+    # moviepy already depends on imageio-ffmpeg, which ships an ffmpeg binary
+    from imageio_ffmpeg import get_ffmpeg_exe
+
+    width, height = size
+    tmp_target = target.with_suffix(".tmp.mp4")
+    command = [
+        get_ffmpeg_exe(),
+        "-y",
+        "-loglevel",
+        "error",
+        "-i",
+        str(source),
+        "-an",
+        "-vf",
+        f"scale={width}:{height}:flags=area",
+        "-c:v",
+        "libx264",
+        "-pix_fmt",
+        "yuv420p",
+        "-g",
+        "1",
+        "-keyint_min",
+        "1",
+        "-crf",
+        str(crf),
+        str(tmp_target),
+    ]
+    logger.info("Transcoding %s -> %s", source, target)
+    try:
+        _ = subprocess.run(command, check=True)
+    except BaseException:
+        tmp_target.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_target, target)
+
+
+def main() -> None:
+    """Transcode every configured video source that exists."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _ = parser.add_argument(
+        "--size",
+        type=parse_size,
+        required=True,
+        help="display resolution as WIDTHxHEIGHT",
+    )
+    _ = parser.add_argument("--crf", type=int, default=18, help="x264 quality")
+    args = parser.parse_args()
+
+    lg.basicConfig(level=lg.INFO, format="%(levelname)s: %(message)s")
+
+    for path in VIDEO_SOURCES.values():
+        source = Path(path)
+        if not source.is_file():
+            logger.warning("Skipping missing video %s", source)
+            continue
+        if source.suffix == ".mp4":
+            # the output would overwrite the file being read
+            logger.warning("Skipping %s, already an .mp4", source)
+            continue
+        transcode(source, source.with_suffix(".mp4"), args.size, args.crf)
+
+
+if __name__ == "__main__":
+    main()
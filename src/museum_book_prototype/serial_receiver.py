@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import codecs
 import logging as lg
 from typing import Callable
 import serial
@@ -15,6 +16,11 @@ if TYPE_CHECKING:
     from museum_book_prototype.app import App
 
 
+RECONNECT_DELAY_MIN: float = 0.1
+RECONNECT_DELAY_MAX: float = 5.0
+PORT_LIST_TTL: float = 1.0
+
+
 class SerialReceiver:
     """Serial receiver class."""
 
@@ -40,6 +46,13 @@ class SerialReceiver:
         self.baudrate: int = baudrate
         self.timeout: float = timeout
         self.serial_port: serial.Serial | None = None
+        # (time.monotonic() of the last scan, USB ports found)
+        self._ports_cache: tuple[float, list[str]] = (0.0, [])
+        # decodes across reads, keeping multibyte sequences split between chunks
+        self._decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+            "utf-8"
+        )(errors="replace")
+        self._rx_buf: str = ""
 
     def list_usb_ports(self) -> list[str]:
         """List available USB serial ports.
@@ -47,8 +60,18 @@ class SerialReceiver:
         Returns:
             list[str]: List of USB serial port device names.
         """
+        now = time.monotonic()
+        scanned_at, cached = self._ports_cache
+        # enumerating ports walks sysfs; reuse a recent non-empty result
+        if cached and now - scanned_at < PORT_LIST_TTL:
+            return cached
+
         ports = serial.tools.list_ports.comports()
-        usb_ports = [port.device for port in ports if "USB" in port.description]
+        usb_ports = [port.device for port in ports if "USB" in (port.description or "")]
+        if not usb_ports:
+            # adapters whose description lacks "USB" still report a vendor id
+            usb_ports = [port.device for port in ports if port.vid is not None]
+        self._ports_cache = (now, usb_ports)
         return usb_ports
 
     def try_connect(self, port: str) -> None:
@@ -57,62 +80,99 @@ class SerialReceiver:
         Args:
             port (str): The serial port to connect to.
         """
-        self.logger.debug(f"Connecting to port: {port}")
+        self.logger.debug("Connecting to port: %s", port)
         self.serial_port = serial.Serial(port, self.baudrate, timeout=self.timeout)
+        self._set_low_latency()
+
+    def _set_low_latency(self) -> None:
+        """Ask the driver to hand over received bytes immediately.
+
+        USB serial adapters (FTDI in particular) otherwise batch input for up to
+        16 ms. Only Linux supports this; other platforms either lack the method
+        or raise NotImplementedError, which is logged and ignored like any other
+        failure.
+        """
+        set_low_latency_mode = getattr(self.serial_port, "set_low_latency_mode", None)
+        if set_low_latency_mode is None:
+            return
+        try:
+            # pyserial sets ASYNC_LOW_LATENCY through TIOCGSERIAL/TIOCSSERIAL
+            set_low_latency_mode(True)
+        except (NotImplementedError, OSError, ValueError) as e:
+            self.logger.debug("Low-latency mode unavailable: %r", e)
 
     def connect(self) -> None:
-        """Connect to the serial port."""
+        """Connect to the serial port, retrying with exponential backoff."""
         self.logger.info("Attempting to connect to serial port...")
-        while True:
-            available_ports = self.list_usb_ports()
-            if available_ports:
-                break
-            self.app.critical_errors["serial_waiting"] = True
-            time.sleep(1)
-
+        delay = RECONNECT_DELAY_MIN
         while not self.is_connected():
-            try:
-                self.try_connect(available_ports[0])
-            except serial.SerialException as e:
-                self.logger.warning(
-                    f"Failed to connect to port: {available_ports[0]}. Retrying... Error: {e}"
-                )
-                self.app.critical_errors["serial_fail"] = True
-                time.sleep(1)
-        else:
-            self.app.critical_errors["serial_fail"] = False
-            self.app.critical_errors["serial_waiting"] = False
-            self.logger.info(f"Connected to serial port: {self.serial_port.port}")
+            available_ports = self.list_usb_ports()
+            if not available_ports:
+                self.app.critical_errors["serial_waiting"] = True
+            else:
+                try:
+                    self.try_connect(available_ports[0])
+                    break
+                except serial.SerialException as e:
+                    self.logger.warning(
+                        "Failed to connect to port: %s. Retrying... Error: %s",
+                        available_ports[0],
+                        e,
+                    )
+                    self.app.critical_errors["serial_fail"] = True
+            time.sleep(delay)
+            delay = min(delay * 2, RECONNECT_DELAY_MAX)
+
+        self.app.critical_errors["serial_fail"] = False
+        self.app.critical_errors["serial_waiting"] = False
+        self.logger.info("Connected to serial port: %s", self.serial_port.port)
 
     def disconnect(self) -> None:
         """Disconnect from the serial port."""
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
             self.serial_port = None
+        # a partial line from the old connection is meaningless
+        self._decoder.reset()
+        self._rx_buf = ""
 
-    def read_line(self) -> str | None:
-        """Read a line from the serial port.
+    def read_lines(self) -> list[str]:
+        """Read every complete line currently available on the serial port.
+
+        Blocks for at most the port timeout when no data is waiting.
 
         Returns:
-            str | None: The read line as a string, or None if not connected.
+            list[str]: The complete lines read, without line endings; empty if not
+                connected or if no full line has arrived yet.
         """
-        if self.serial_port and self.serial_port.is_open:
-            try:
-                line_raw = self.serial_port.readline()
-            except serial.SerialException:
-                self.disconnect()
-                return None
-
-            try:
-                line = line_raw.decode("utf-8").strip()
-            except UnicodeDecodeError as e:
-                self.logger.error(
-                    f"Invalid data received. Skipping line: {line_raw}. Error: {e}"
-                )
-                return None
-
-            return line
-        return None
+        if not (self.serial_port and self.serial_port.is_open):
+            return []
+
+        try:
+            # one read for everything buffered instead of readline()'s per-byte reads
+            chunk = self.serial_port.read(self.serial_port.in_waiting or 1)
+        except OSError:
+            # SerialException, or a bare EIO from in_waiting once the tty hangs up
+            self.disconnect()
+            return []
+
+        text = self._decoder.decode(chunk)
+        self._rx_buf += text
+        if "\n" not in text:
+            return []
+
+        *raw_lines, self._rx_buf = self._rx_buf.split("\n")
+        lines: list[str] = []
+        for line in map(str.strip, raw_lines):
+            if not line:
+                continue
+            # undecodable bytes arrive as U+FFFD; drop the whole line so a
+            # garbled packet never reaches the parser as a partial update
+            if "\ufffd" in line:
+                self.logger.error("Invalid data received. Skipping line: %r", line)
+                continue
+            lines.append(line)
+        return lines
 
     def is_connected(self) -> bool:
         """Check if the serial port is connected."""
@@ -125,13 +185,11 @@ class SerialReceiver:
         line = ""
         while True:
             if self.is_connected():
-                old_line = line
-                line = self.read_line()
-
-                if old_line != line:
-                    self.logger.info(f"Switches changed: {line}")
+                for new_line in self.read_lines():
+                    if new_line != line:
+                        line = new_line
+                        self.logger.info("Switches changed: %s", line)
 
-                if line:
                     self.parse_callback(line)
 
                 # if line:
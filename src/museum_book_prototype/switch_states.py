@@ -7,6 +7,20 @@ import logging as lg
 from typing import Callable
 
 
+PAGE_COUNT: int = 5
+OPEN_KEYS: tuple[str, ...] = tuple(f"page{i}_open" for i in range(1, PAGE_COUNT + 1))
+CLOSE_KEYS: tuple[str, ...] = tuple(
+    f"page{i}_close" for i in range(1, PAGE_COUNT + 1)
+)
+# (open key, close key) per page, in the order the app expects them
+PAGE_KEYS: tuple[tuple[str, str], ...] = tuple(zip(OPEN_KEYS, CLOSE_KEYS))
+# switch key -> (is a CLOSED switch, bit of its page)
+KEY_TO_BIT: dict[str, tuple[bool, int]] = {
+    **{key: (False, 1 << i) for i, key in enumerate(OPEN_KEYS)},
+    **{key: (True, 1 << i) for i, key in enumerate(CLOSE_KEYS)},
+}
+
+
 class SwitchStates:
     """Switch states class."""
 
@@ -20,20 +34,28 @@ class SwitchStates:
         self.logger: lg.Logger = lg.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.logger.debug("Initializing SwitchStates...")
         self.app_callback: Callable[[dict[str, bool], str], None] = app_callback
-        self.states: dict[str, bool] = {
-            "page1_open": False,
-            "page1_close": False,
-            "page2_open": False,
-            "page2_close": False,
-            "page3_open": False,
-            "page3_close": False,
-            "page4_open": False,
-            "page4_close": False,
-            "page5_open": False,
-            "page5_close": False,
-        }
+        # bit i set = page i + 1 switch active
+        self.open_mask: int = 0
+        self.close_mask: int = 0
+        # pages with both switches active; only recomputed when the masks change
+        self._conflict_mask: int = 0
         self.error: str = ""
 
+    @property
+    def states(self) -> dict[str, bool]:
+        """Return the switch states keyed by switch name.
+
+        Returns:
+            dict[str, bool]: Switch states.
+        """
+        open_mask = self.open_mask
+        close_mask = self.close_mask
+        states: dict[str, bool] = {}
+        for i, (open_key, close_key) in enumerate(PAGE_KEYS):
+            states[open_key] = bool(open_mask >> i & 1)
+            states[close_key] = bool(close_mask >> i & 1)
+        return states
+
     def validate_states(self) -> bool:
         """Validate the current switch states.
 
@@ -41,29 +63,65 @@ class SwitchStates:
             bool: True if states are valid, False otherwise.
         """
         # Example validation: ensure no page is both open and closed
-        for i in range(1, 6):
-            if self.states[f"page{i}_open"] and self.states[f"page{i}_close"]:
-                self.logger.error(
-                    f"Invalid state: page {i} cannot be both open and closed."
-                )
-                return False
-        return True
+        return not self._conflict_mask
 
     def update_states(self, new_states: dict[str, bool]) -> None:
-        """Update the switch states and notify if there are changes.
+        """Update the switch states and notify the app if any of them changed.
 
         Args:
             new_states (dict[str, bool]): New switch states to update.
         """
+        open_mask = self.open_mask
+        close_mask = self.close_mask
         for key, new_value in new_states.items():
-            old_value = self.states.get(key)
-            if old_value is None:
-                self.logger.warning(f"Unknown switch state key: {key}")
+            entry = KEY_TO_BIT.get(key)
+            if entry is None:
+                self.logger.warning("Unknown switch state key: %s", key)
                 continue
-            if old_value != new_value:
-                self.logger.debug(
-                    f"Switch state changed: {key} from {old_value} to {new_value}"
-                )
-                self.states[key] = new_value
+            is_close, bit = entry
+            if is_close:
+                close_mask = close_mask | bit if new_value else close_mask & ~bit
+            else:
+                open_mask = open_mask | bit if new_value else open_mask & ~bit
+
+        if open_mask == self.open_mask and close_mask == self.close_mask:
+            # nothing changed; do not wake the app
+            return
+
+        if self.logger.isEnabledFor(lg.DEBUG):
+            self._log_changes(OPEN_KEYS, self.open_mask, open_mask)
+            self._log_changes(CLOSE_KEYS, self.close_mask, close_mask)
+        self.open_mask = open_mask
+        self.close_mask = close_mask
+
+        conflict = open_mask & close_mask
+        if conflict != self._conflict_mask:
+            # the app reports the contactor fault itself; only note new conflicts here
+            new_conflict = conflict & ~self._conflict_mask
+            self._conflict_mask = conflict
+            for i in range(PAGE_COUNT):
+                if new_conflict >> i & 1:
+                    self.logger.warning(
+                        "Invalid state: page %d cannot be both open and closed.", i + 1
+                    )
 
         self.app_callback(self.states)
+
+    def _log_changes(self, keys: tuple[str, ...], old_mask: int, new_mask: int) -> None:
+        """Log every switch whose bit differs between two masks.
+
+        Args:
+            keys (tuple[str, ...]): Switch keys indexed by page bit.
+            old_mask (int): Previous switch mask.
+            new_mask (int): Updated switch mask.
+        """
+        changed = old_mask ^ new_mask
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            self.logger.debug(
+                "Switch state changed: %s from %s to %s",
+                keys[bit.bit_length() - 1],
+                bool(old_mask & bit),
+                bool(new_mask & bit),
+            )
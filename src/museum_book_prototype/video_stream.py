@@ -3,27 +3,46 @@
 
 import json
 import logging as lg
+import os
 import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 import pygame as pg
 
-from moviepy import VideoFileClip
+
+LOADER_QUEUE_SIZE: int = 8
+CACHE_WRITERS: int = min(4, os.cpu_count() or 1)
+SOURCE_MTIME_TTL: float = 1.0
 
 
 @dataclass(slots=True)
 class VideoStream:
-    """Stream video frames from an on-disk cache of predecoded surfaces."""
+    """Stream video frames from an on-disk cache of predecoded RGB frames."""
 
     path: str
     fps_limit: float
     target_size: tuple[int, int]
     cache_root: Path
     logger: lg.Logger
-
-    frame_paths: list[Path] = field(default_factory=list, init=False)
+    preload: bool = False
+    smooth_scaling: bool = True
+    surface_cache_size: int = 0
+
+    frames: np.memmap | None = field(default=None, init=False, repr=False)
+    surfaces: list[pg.Surface] = field(default_factory=list, init=False)
+    first_frame: pg.Surface | None = field(default=None, init=False, repr=False)
+    # display-ready surfaces for the opening frames, kept across page visits
+    _surface_cache: dict[int, pg.Surface] = field(
+        default_factory=dict, init=False, repr=False
+    )
     fps: float = 0.0
+    frame_count: int = 0
     frame_duration: float = 0.0
     accumulator: float = 0.0
     elapsed_time: float = 0.0
@@ -32,11 +51,34 @@ class VideoStream:
     last_surface: pg.Surface | None = None
     duration_seconds: float = 0.0
 
+    _frame_queue: deque[tuple[int, pg.Surface]] | None = field(
+        default=None, init=False, repr=False
+    )
+    _queue_cond: threading.Condition | None = field(
+        default=None, init=False, repr=False
+    )
+    # (time.monotonic() of the last stat, source mtime)
+    _source_stat: tuple[float, float] | None = field(
+        default=None, init=False, repr=False
+    )
+    # display-format surfaces the loader decodes into, reused round robin
+    _loader_surfaces: list[pg.Surface] = field(
+        default_factory=list, init=False, repr=False
+    )
+    # index of the next frame the loader will queue
+    _next_loaded: int = field(default=0, init=False, repr=False)
+    _loader: threading.Thread | None = field(default=None, init=False, repr=False)
+    _stop_loading: threading.Event | None = field(
+        default=None, init=False, repr=False
+    )
+
     def reset(self) -> None:
-        """Restart playback from the first frame, building cache on demand."""
+        """Rewind playback to the first frame, building cache on first use."""
 
-        self.ensure_cache()
-        if not self.frame_paths:
+        # the cache is validated once; later resets only rewind
+        if not self.frame_count:
+            self.ensure_cache()
+        if not self.frame_count:
             raise RuntimeError(f"No cached frames available for {self.path}")
 
         self.accumulator = 0.0
@@ -44,46 +86,65 @@ class VideoStream:
         self.frame_index = 0
         self.finished = False
         self.last_surface = None
+        self._stop_loader()
         self._load_frame(self.frame_index)
+        # let the loader start after the frames that are already cached
+        start = self.frame_index + 1
+        while start in self._surface_cache:
+            start += 1
+        self._start_loader(start)
 
     def ensure_cache(self) -> None:
         """Make sure a decoded frame cache exists and is in sync with the source."""
 
         metadata = self._read_metadata()
-        self._refresh_frame_paths()
+        frames = self._map_cache(metadata)
 
-        if not self._cache_is_valid(metadata):
+        if frames is None:
             self.logger.info("Building frame cache for %s", self.path)
             self._rebuild_cache()
             metadata = self._read_metadata()
-            self._refresh_frame_paths()
+            frames = self._map_cache(metadata)
 
-        if not metadata or not self.frame_paths:
+        if frames is None:
             raise RuntimeError(f"Cache build failed for {self.path}")
 
-        self._apply_metadata(metadata)
+        self._apply_metadata(metadata, frames)
+
+        if self.preload and len(self.surfaces) != self.frame_count:
+            self._preload_surfaces()
+
+        # keep the first frame ready so switching to this page shows it at once;
+        # the cache was just validated, so a failure here is not retried
+        if self.first_frame is None:
+            self.first_frame = (
+                self.surfaces[0] if self.surfaces else self._decode_frame(0)
+            )
 
     def advance(self, dt: float) -> pg.Surface | None:
         """Return the surface for the current playback time after advancing."""
 
-        if not self.frame_paths:
+        if not self.frame_count:
             return self.last_surface
 
         if self.finished:
             return self.last_surface
 
         self.accumulator += dt
-
-        while self.accumulator >= self.frame_duration and not self.finished:
-            self.accumulator -= self.frame_duration
-            next_index = self.frame_index + 1
-            if next_index >= len(self.frame_paths):
+        frame_duration = self.frame_duration
+        last_index = self.frame_count - 1
+
+        # jump straight to the due frame; skipped frames are never shown
+        steps = int(self.accumulator // frame_duration)
+        if steps:
+            self.accumulator -= steps * frame_duration
+            next_index = self.frame_index + steps
+            if next_index > last_index:
                 self.finished = True
-                self.frame_index = len(self.frame_paths) - 1
                 self.accumulator = 0.0
-            else:
-                self.frame_index = next_index
-                self._load_frame(self.frame_index)
+                next_index = last_index
+            if next_index != self.frame_index:
+                self._load_frame(next_index)
 
         if self.finished and self.last_surface is None:
             self._load_frame(self.frame_index)
@@ -91,8 +152,8 @@ class VideoStream:
         if self.finished:
             self.elapsed_time = self.duration
         else:
-            self.elapsed_time = self.frame_index * self.frame_duration + min(
-                self.accumulator, self.frame_duration
+            self.elapsed_time = self.frame_index * frame_duration + min(
+                self.accumulator, frame_duration
             )
 
         return self.last_surface
@@ -100,6 +161,7 @@ class VideoStream:
     def close(self) -> None:
         """Release references to loaded surfaces."""
 
+        self._stop_loader()
         self.accumulator = 0.0
         self.elapsed_time = 0.0
         self.frame_index = 0
@@ -119,46 +181,246 @@ class VideoStream:
 
         return self.cache_dir / "metadata.json"
 
+    @property
+    def frames_path(self) -> Path:
+        """Return the ``.npy`` file holding every cached RGB frame."""
+
+        return self.cache_dir / "frames.npy"
+
     @property
     def duration(self) -> float:
         """Total duration of the clip represented by this stream."""
 
         if self.duration_seconds > 0:
             return self.duration_seconds
-        return len(self.frame_paths) * self.frame_duration if self.frame_paths else 0.0
+        return self.frame_count * self.frame_duration
 
     def _load_frame(self, index: int) -> None:
-        """Load a frame surface from disk into memory."""
+        """Make the frame at ``index`` the current surface."""
 
-        if not self.frame_paths:
+        if not self.frame_count:
             return
 
-        clamped = max(0, min(index, len(self.frame_paths) - 1))
-        frame_path = self.frame_paths[clamped]
-        while True:
+        clamped = max(0, min(index, self.frame_count - 1))
+        if self.surfaces:
+            self.last_surface = self.surfaces[clamped]
+        elif clamped == 0 and self.first_frame is not None:
+            self.last_surface = self.first_frame
+        else:
+            surface = self._surface_cache.get(clamped)
+            if surface is None:
+                loaded = self._take_loaded(clamped)
+                surface = loaded if loaded is not None else self._read_surface(clamped)
+                # keep the head of the clip rather than evicting it: a page
+                # revisit always replays from the start
+                if len(self._surface_cache) < self.surface_cache_size:
+                    # the loader reuses its surfaces, so keep a copy of those
+                    self._surface_cache[clamped] = (
+                        surface.copy() if loaded is not None else surface
+                    )
+            self.last_surface = surface
+        self.frame_index = clamped
+
+    def _read_surface(self, index: int) -> pg.Surface:
+        """Load a frame surface from disk, recaching once on failure."""
+
+        try:
+            return self._decode_frame(index)
+        except Exception:  # noqa: BLE001
+            self.logger.exception(
+                "Failed to load cached frame %d of %s", index, self.path
+            )
+
+        # try to recache; a rebuild stops the loader, so restart it afterwards
+        was_loading = self._loader is not None
+        self.ensure_cache()
+        surface = self._decode_frame(index)
+        if was_loading:
+            self._start_loader(index + 1)
+        return surface
+
+    def _decode_frame(self, index: int, into: pg.Surface | None = None) -> pg.Surface:
+        """Convert a single cached frame to the display format.
+
+        Args:
+            index (int): Frame index.
+            into (pg.Surface | None): Display-format surface to overwrite instead
+                of allocating a new one.
+
+        Returns:
+            pg.Surface: The converted frame.
+        """
+
+        # the memmap row is contiguous; wrap it in place and copy once, converting
+        frame = pg.image.frombuffer(self.frames[index], self.target_size, "RGB")
+        if into is None:
+            return frame.convert()
+        _ = into.blit(frame, (0, 0))
+        return into
+
+    def _start_loader(self, start: int) -> None:
+        """Start loading frames from ``start`` onwards in a background thread."""
+
+        self._stop_loader()
+        if self.surfaces or start >= self.frame_count:
+            return
+
+        if not self._loader_surfaces:
+            # queued frames plus the one on screen and the one being decoded
+            self._loader_surfaces = [
+                pg.Surface(self.target_size).convert()
+                for _ in range(LOADER_QUEUE_SIZE + 2)
+            ]
+
+        frame_queue: deque[tuple[int, pg.Surface]] = deque()
+        cond = threading.Condition()
+        stop = threading.Event()
+        loader = threading.Thread(
+            name=f"VideoLoader[{Path(self.path).stem}]",
+            target=self._load_ahead,
+            args=(start, self._loader_surfaces, frame_queue, cond, stop),
+            daemon=True,
+        )
+        self._frame_queue = frame_queue
+        self._queue_cond = cond
+        self._next_loaded = start
+        self._stop_loading = stop
+        self._loader = loader
+        loader.start()
+
+    def _stop_loader(self) -> None:
+        """Signal the background loader to stop and drop its queued frames."""
+
+        if self._queue_cond is not None and self._stop_loading is not None:
+            with self._queue_cond:
+                self._stop_loading.set()
+                # wake the loader if it is waiting for room in the queue
+                self._queue_cond.notify_all()
+        if self._loader is not None:
+            # the next loader reuses its surfaces; it exits after one frame at most
+            self._loader.join()
+        self._frame_queue = None
+        self._queue_cond = None
+        self._stop_loading = None
+        self._loader = None
+
+    def _load_ahead(
+        self,
+        start: int,
+        surfaces: list[pg.Surface],
+        frame_queue: deque[tuple[int, pg.Surface]],
+        cond: threading.Condition,
+        stop: threading.Event,
+    ) -> None:
+        """Background loop feeding upcoming frames into ``frame_queue``."""
+
+        for index in range(start, self.frame_count):
+            if stop.is_set():
+                return
+            surface = surfaces[(index - start) % len(surfaces)]
             try:
-                surface = pg.image.load(str(frame_path))
+                self._decode_frame(index, into=surface)
             except Exception:  # noqa: BLE001
-                self.logger.exception("Failed to load cached frame %s", frame_path)
-                # try to recache
-                self.ensure_cache()
-            else:
-                break
+                # a stopped loader may race the display shutting down
+                if not stop.is_set():
+                    # leave the retry/recache logic to the render thread
+                    self.logger.warning("Background load of frame %d failed", index)
+                with cond:
+                    # do not leave the render thread waiting for this frame
+                    cond.notify()
+                return
+
+            with cond:
+                while len(frame_queue) >= LOADER_QUEUE_SIZE and not stop.is_set():
+                    _ = cond.wait()
+                if stop.is_set():
+                    return
+                frame_queue.append((index, surface))
+                cond.notify()
+
+    def _take_loaded(self, index: int) -> pg.Surface | None:
+        """Return the loader's surface for ``index``.
+
+        If the loader has not reached ``index`` yet, wait up to one frame
+        duration for it rather than decoding the same frame twice.
+        """
+
+        frame_queue = self._frame_queue
+        cond = self._queue_cond
+        loader = self._loader
+        if frame_queue is None or cond is None or loader is None:
+            return None
 
-        if surface.get_size() != self.target_size:
-            surface = pg.transform.smoothscale(surface, self.target_size)
-        self.last_surface = surface.convert()
-        self.frame_index = clamped
+        deadline = time.monotonic() + self.frame_duration
+        with cond:
+            while True:
+                taken = False
+                while frame_queue and frame_queue[0][0] <= index:
+                    loaded_index, surface = frame_queue.popleft()
+                    self._next_loaded = loaded_index + 1
+                    taken = True
+                    if loaded_index == index:
+                        # there is room in the queue again
+                        cond.notify()
+                        return surface
+                if taken:
+                    cond.notify()
+
+                # the frame was skipped or the loader gave up; read it directly
+                if frame_queue or index < self._next_loaded or not loader.is_alive():
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                _ = cond.wait(remaining)
+
+    def _preload_surfaces(self) -> None:
+        """Keep every cached frame in memory as a display-ready surface."""
+
+        self.logger.info("Preloading %d frames for %s", self.frame_count, self.path)
+        self.surfaces = [self._decode_frame(index) for index in range(self.frame_count)]
 
     def _rebuild_cache(self) -> None:
-        """Decode the source video and persist frames to disk."""
-
+        """Decode the source video and persist its frames to a ``.npy`` file."""
+
+        # moviepy is slow to import and only needed when (re)building a cache
+        from moviepy import VideoFileClip
+        from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+        # the loader reads the mapping and surfaces that are about to go away
+        self._stop_loader()
+        self.surfaces.clear()
+        self._surface_cache.clear()
+        self._loader_surfaces = []
+        self.first_frame = None
+        self.frames = None
         if self.cache_dir.exists():
             shutil.rmtree(self.cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        frame_paths: list[Path] = []
-        with VideoFileClip(self.path, audio=False) as clip:
+        width, height = self.target_size
+        frame_count = 0
+        if not self.smooth_scaling:
+            resize_algorithm = "fast_bilinear"
+        else:
+            infos = ffmpeg_parse_infos(self.path)
+            source_width, source_height = infos.get("video_size") or (0, 0)
+            # ffmpeg applies the rotation while decoding, swapping the axes
+            if abs(infos.get("video_rotation", 0)) in (90, 270):
+                source_width, source_height = source_height, source_width
+            # area averaging is the sharpest, alias-free filter for shrinking
+            if source_width >= width and source_height >= height:
+                resize_algorithm = "area"
+            else:
+                resize_algorithm = "bicubic"
+
+        # let ffmpeg scale while decoding instead of resampling every surface
+        with VideoFileClip(
+            self.path,
+            audio=False,
+            target_resolution=self.target_size,
+            resize_algorithm=resize_algorithm,
+        ) as clip:
             source_fps = clip.fps or 24.0
             playback_fps = (
                 min(source_fps, self.fps_limit) if self.fps_limit > 0 else source_fps
@@ -166,83 +428,163 @@ class VideoStream:
             if playback_fps <= 0:
                 playback_fps = 24.0
 
-            for index, frame in enumerate(
-                clip.iter_frames(fps=playback_fps, dtype="uint8")
-            ):
-                surface = pg.surfarray.make_surface(frame.swapaxes(0, 1))
-                if surface.get_size() != self.target_size:
-                    surface = pg.transform.smoothscale(surface, self.target_size)
-                surface = surface.convert()
-                frame_path = self.cache_dir / f"frame_{index:05d}.bmp"
-                pg.image.save(surface, frame_path)
-                frame_paths.append(frame_path)
+            # iter_frames yields exactly this many frames
+            expected_count = int((clip.duration or 0.0) * playback_fps)
+            if expected_count <= 0:
+                raise RuntimeError(f"No frames decoded from {self.path}")
 
-            duration = float(clip.duration or len(frame_paths) / playback_fps)
-
-        if not frame_paths:
-            raise RuntimeError(f"No frames decoded from {self.path}")
+            frames = np.lib.format.open_memmap(
+                self.frames_path,
+                mode="w+",
+                dtype=np.uint8,
+                shape=(expected_count, height, width, 3),
+            )
+            # copy frames into their slots on worker threads while ffmpeg keeps
+            # decoding; each worker writes its own slice, so no lock is needed
+            pending: deque[Future[None]] = deque()
+            with ThreadPoolExecutor(
+                max_workers=CACHE_WRITERS, thread_name_prefix="CacheWriter"
+            ) as writers:
+                for frame in clip.iter_frames(fps=playback_fps, dtype="uint8"):
+                    if frame_count == expected_count:
+                        break
+                    if len(pending) >= 2 * CACHE_WRITERS:
+                        # bound the decoded frames held in memory
+                        pending.popleft().result()
+                    pending.append(
+                        writers.submit(self._store_frame, frames, frame_count, frame)
+                    )
+                    frame_count += 1
+                for future in pending:
+                    future.result()
+
+            if not frame_count:
+                raise RuntimeError(f"No frames decoded from {self.path}")
+            if frame_count < expected_count:
+                # never leave unwritten slots; hold the last frame instead
+                self.logger.warning(
+                    "Decoded %d of %d frames from %s; repeating the last frame",
+                    frame_count,
+                    expected_count,
+                    self.path,
+                )
+                frames[frame_count:] = frames[frame_count - 1]
+                frame_count = expected_count
+            frames.flush()
+            del frames
+
+            duration = float(clip.duration)
 
         metadata = {
             "fps": playback_fps,
-            "frame_count": len(frame_paths),
+            "frame_count": frame_count,
             "duration": duration,
-            "width": self.target_size[0],
-            "height": self.target_size[1],
+            "width": width,
+            "height": height,
             "fps_limit": self.fps_limit,
-            "source_mtime": Path(self.path).stat().st_mtime,
+            "smooth_scaling": self.smooth_scaling,
+            "resize_algorithm": resize_algorithm,
+            "source_mtime": self._source_mtime(max_age=0.0),
         }
 
         self._write_metadata(metadata)
 
-    def _refresh_frame_paths(self) -> None:
-        """Populate the in-memory list of cached frame paths."""
+    def _store_frame(self, frames: np.memmap, index: int, frame: np.ndarray) -> None:
+        """Write a decoded frame into slot ``index`` of the frame cache."""
+
+        frames[index] = self._fit_frame(frame)
 
-        if self.cache_dir.is_dir():
-            self.frame_paths = sorted(self.cache_dir.glob("frame_*.bmp"))
+    def _fit_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Return a decoded ``(H, W, 3)`` frame at the target size."""
+
+        height, width = frame.shape[:2]
+        if (width, height) == self.target_size:
+            return frame
+
+        # ffmpeg normally delivers target-sized frames; scale anything else once,
+        # here, so playback never has to resample
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        surface = pg.image.frombuffer(frame, (width, height), "RGB")
+        if self.smooth_scaling:
+            surface = pg.transform.smoothscale(surface, self.target_size)
         else:
-            self.frame_paths = []
+            surface = pg.transform.scale(surface, self.target_size)
+        target_width, target_height = self.target_size
+        return np.frombuffer(pg.image.tobytes(surface, "RGB"), dtype=np.uint8).reshape(
+            target_height, target_width, 3
+        )
 
-    def _apply_metadata(self, metadata: dict[str, object]) -> None:
-        """Update playback parameters from cached metadata."""
+    def _apply_metadata(self, metadata: dict[str, object], frames: np.memmap) -> None:
+        """Update playback parameters from cached metadata and use ``frames``."""
 
         fps = float(metadata.get("fps", 24.0))
         if fps <= 0:
             fps = 24.0
         self.fps = fps
+        self.frame_count = int(metadata["frame_count"])
         self.frame_duration = 1.0 / fps
         self.duration_seconds = float(
-            metadata.get("duration", len(self.frame_paths) * self.frame_duration)
+            metadata.get("duration", self.frame_count * self.frame_duration)
         )
+        self.frames = frames
 
-    def _cache_is_valid(self, metadata: dict[str, object] | None) -> bool:
-        """Return True if the cached frames match the source video."""
+    def _map_cache(self, metadata: dict[str, object] | None) -> np.memmap | None:
+        """Map the cached frames if they match the source video.
 
-        if not metadata:
-            return False
+        Returns:
+            np.memmap | None: The ``frame_count`` cached frames, or None if the
+                cache is missing or stale.
+        """
 
-        if not self.frame_paths:
-            return False
+        if not metadata:
+            return None
 
-        source_mtime = Path(self.path).stat().st_mtime
+        frame_count = metadata.get("frame_count")
+        if not isinstance(frame_count, int) or frame_count <= 0:
+            return None
 
-        return (
-            metadata.get("source_mtime") == source_mtime
-            and metadata.get("width") == self.target_size[0]
-            and metadata.get("height") == self.target_size[1]
+        width, height = self.target_size
+        # compare the metadata first; only a matching cache needs its file opened
+        if not (
+            metadata.get("width") == width
+            and metadata.get("height") == height
             and metadata.get("fps_limit") == self.fps_limit
-            and metadata.get("frame_count") == len(self.frame_paths)
-        )
+            and metadata.get("smooth_scaling", True) == self.smooth_scaling
+            and metadata.get("source_mtime") == self._source_mtime()
+        ):
+            return None
+
+        try:
+            frames = np.load(self.frames_path, mmap_mode="r")
+        except (OSError, ValueError):
+            # missing or truncated frames file
+            return None
+        if (
+            frames.dtype != np.uint8
+            or frames.shape[1:] != (height, width, 3)
+            or frames.shape[0] != frame_count
+        ):
+            return None
+        return frames
+
+    def _source_mtime(self, max_age: float = SOURCE_MTIME_TTL) -> float:
+        """Return the source video's mtime, reusing a stat younger than ``max_age``."""
+
+        now = time.monotonic()
+        if self._source_stat is not None and now - self._source_stat[0] < max_age:
+            return self._source_stat[1]
+        mtime = Path(self.path).stat().st_mtime
+        self._source_stat = (now, mtime)
+        return mtime
 
     def _read_metadata(self) -> dict[str, object] | None:
         """Read cache metadata from disk if it exists."""
 
-        metadata_path = self.metadata_path
-        if not metadata_path.is_file():
-            return None
-
         try:
-            with metadata_path.open("r", encoding="utf-8") as handle:
+            with self.metadata_path.open("r", encoding="utf-8") as handle:
                 return json.load(handle)
+        except FileNotFoundError:
+            return None
         except Exception:  # noqa: BLE001
             self.logger.warning("Failed to read cache metadata for %s", self.path)
             return None
@@ -250,5 +592,11 @@ class VideoStream:
     def _write_metadata(self, metadata: dict[str, object]) -> None:
         """Persist cache metadata alongside the cached frames."""
 
-        with self.metadata_path.open("w", encoding="utf-8") as handle:
+        # write a temporary file and rename it over the old one, so a crash
+        # never leaves truncated metadata that would force a full rebuild
+        tmp_path = self.metadata_path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
             json.dump(metadata, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self.metadata_path)